@@ -1,5 +1,6 @@
 """Package for Cat-VRS Python implementation"""
 
 from . import profile_models as cat_vrs_models
+from .core_models import adapter
 
-__all__ = ["cat_vrs_models"]
+__all__ = ["adapter", "cat_vrs_models"]
@@ -4,12 +4,39 @@ See the `CatVar page <https://www.ga4gh.org/product/categorical-variation-catvar
 the GA4GH website for more information.
 """
 
+import os
 from enum import Enum
-from typing import Literal
+from functools import cache
+from typing import Annotated, Literal
 
 from ga4gh.core.entity_models import IRI, Coding, DomainEntity
 from ga4gh.vrs.models import CopyChange, Location, Range, Variation
-from pydantic import BaseModel, Field, RootModel, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_validator,
+)
+
+_KEEP_DESC = os.getenv("CATVRS_FIELD_DOCS", "1").strip().lower() not in {
+    "0",
+    "false",
+    "no",
+}
+
+
+def _desc(description: str) -> str | None:
+    """Get a field description, unless field docs are disabled
+
+    Set the ``CATVRS_FIELD_DOCS`` environment variable to ``"0"``, ``"false"`` or
+    ``"no"`` (case-insensitive) to drop field descriptions (e.g. to reduce memory use
+    in production). Any other value keeps them.
+
+    :param description: Field description
+    :return: ``description``, or ``None`` if field docs are disabled
+    """
+    return description if _KEEP_DESC else None
 
 
 class Relation(str, Enum):
@@ -32,21 +59,28 @@ class DefiningContextConstraint(BaseModel):
     which categorical variation is being described.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["DefiningContextConstraint"] = Field(
-        "DefiningContextConstraint", description="MUST be 'DefiningContextConstraint'"
+        "DefiningContextConstraint",
+        description=_desc("MUST be 'DefiningContextConstraint'"),
     )
     definingContext: Variation | Location | IRI  # noqa: N815
     relations: list[Relation] | None = Field(
         None,
-        description="Defined relationships between members of the categorical variant and the defining context. ``sequence_liftover`` refers to variants or locations that represent a congruent concept on a differing assembly of a human genome (e.g. 'GRCh37' and 'GRCh38') or gene (e.g. Locus Reference Genomic) sequence. ``transcript_projection`` refers to variants or locations that occur on transcripts projected from the defined genomic concept. ``codon_translation`` refers to variants or locations that translate from the codon(s) represented by the defined concept.",
+        description=_desc(
+            "Defined relationships between members of the categorical variant and the defining context. ``sequence_liftover`` refers to variants or locations that represent a congruent concept on a differing assembly of a human genome (e.g. 'GRCh37' and 'GRCh38') or gene (e.g. Locus Reference Genomic) sequence. ``transcript_projection`` refers to variants or locations that occur on transcripts projected from the defined genomic concept. ``codon_translation`` refers to variants or locations that translate from the codon(s) represented by the defined concept."
+        ),
     )
 
 
 class CopyCountConstraint(BaseModel):
     """The absolute number of copies in a system"""
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["CopyCountConstraint"] = Field(
-        "CopyCountConstraint", description="MUST be 'CopyCountConstraint'"
+        "CopyCountConstraint", description=_desc("MUST be 'CopyCountConstraint'")
     )
     copies: int | Range
 
@@ -54,8 +88,10 @@ class CopyCountConstraint(BaseModel):
 class CopyChangeConstraint(BaseModel):
     """A representation of copy number change"""
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["CopyChangeConstraint"] = Field(
-        "CopyChangeConstraint", description="MUST be 'CopyChangeConstraint'"
+        "CopyChangeConstraint", description=_desc("MUST be 'CopyChangeConstraint'")
     )
     copyChange: Coding  # noqa: N815
 
@@ -76,12 +112,11 @@ class CopyChangeConstraint(BaseModel):
         return v
 
 
-class Constraint(RootModel):
-    """Constraints are used to construct an intensional semantics of categorical variant types."""
-
-    root: DefiningContextConstraint | CopyCountConstraint | CopyChangeConstraint = (
-        Field(..., discriminator="type")
-    )
+# Constraints are used to construct an intensional semantics of categorical variant types.
+Constraint = Annotated[
+    DefiningContextConstraint | CopyCountConstraint | CopyChangeConstraint,
+    Field(discriminator="type"),
+]
 
 
 class CategoricalVariant(DomainEntity):
@@ -89,11 +124,32 @@ class CategoricalVariant(DomainEntity):
     individual contextual variation instances may be members of the domain.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["CategoricalVariant"] = Field(
-        "CategoricalVariant", description="MUST be 'CategoricalVariant'"
+        "CategoricalVariant", description=_desc("MUST be 'CategoricalVariant'")
     )
     members: list[Variation | IRI] | None = Field(
         None,
-        description="A non-exhaustive list of VRS variation contexts that satisfy the constraints of this categorical variant.",
+        description=_desc(
+            "A non-exhaustive list of VRS variation contexts that satisfy the constraints of this categorical variant."
+        ),
     )
     constraints: list[Constraint] | None = None
+
+
+@cache
+def adapter(cls: type) -> TypeAdapter:
+    """Get a cached type adapter for a Cat-VRS model or type
+
+    Building a ``TypeAdapter`` is expensive, so adapters are created once per type and
+    reused:
+
+    >>> from ga4gh.cat_vrs.core_models import Constraint, adapter
+    >>> adapter(Constraint).validate_python({"type": "CopyCountConstraint", "copies": 2})
+    CopyCountConstraint(type='CopyCountConstraint', copies=2)
+
+    :param cls: Model class or type (e.g. ``Constraint``) to get the adapter for
+    :return: Type adapter for ``cls``
+    """
+    return TypeAdapter(cls)
@@ -14,7 +14,7 @@ from ga4gh.cat_vrs.core_models import (
     DefiningContextConstraint,
     Relation,
 )
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class CatVrsType(str, Enum):
@@ -32,6 +32,8 @@ class CatVrsType(str, Enum):
 class ProteinSequenceConsequenceProperties(BaseModel):
     """Cat-VRS Constraints found in Protein Sequence Consequences."""
 
+    model_config = ConfigDict(defer_build=True)
+
     constraints: list[Constraint] = Field(..., min_length=1)
 
     @field_validator("constraints")
@@ -45,7 +47,9 @@ class ProteinSequenceConsequenceProperties(BaseModel):
         :return: Constraints property
         """
         if not any(
-            constraint.relations.count(Relation.CODON_TRANSLATION) == 1
+            isinstance(constraint, DefiningContextConstraint)
+            and constraint.relations
+            and constraint.relations.count(Relation.CODON_TRANSLATION) == 1
             for constraint in v
         ):
             err_msg = f"At least one `relations` in `constraints` must contain `{Relation.CODON_TRANSLATION.value}` exactly once."
@@ -70,6 +74,8 @@ class ProteinSequenceConsequence(
 class CanonicalAlleleProperties(BaseModel):
     """Cat-VRS Constraints found in Canonical Alleles."""
 
+    model_config = ConfigDict(defer_build=True)
+
     constraints: list[Constraint] = Field(..., min_length=1)
 
     @field_validator("constraints")
@@ -84,13 +90,13 @@ class CanonicalAlleleProperties(BaseModel):
         :return: Constraints property
         """
         if not any(
-            (
-                constraint.relations.count(Relation.SEQUENCE_LIFTOVER) == 1
-                and constraint.relations.count(Relation.TRANSCRIPT_PROJECTION) == 1
-            )
+            isinstance(constraint, DefiningContextConstraint)
+            and constraint.relations
+            and constraint.relations.count(Relation.SEQUENCE_LIFTOVER) == 1
+            and constraint.relations.count(Relation.TRANSCRIPT_PROJECTION) == 1
             for constraint in v
         ):
-            err_msg = f"At least one `relations` in `constraints` must contain {Relation.SEQUENCE_LIFTOVER} and {Relation.TRANSCRIPT_PROJECTION} exactly once."
+            err_msg = f"At least one `relations` in `constraints` must contain `{Relation.SEQUENCE_LIFTOVER.value}` and `{Relation.TRANSCRIPT_PROJECTION.value}` exactly once."
             raise ValueError(err_msg)
 
         return v
@@ -109,6 +115,8 @@ class CanonicalAllele(CanonicalAlleleProperties, CategoricalVariant):
 class CategoricalCnvProperties(BaseModel):
     """Cat-VRS Constraints found in CategoricalCnvs."""
 
+    model_config = ConfigDict(defer_build=True)
+
     constraints: list[Constraint] = Field(..., min_length=1)
 
     @field_validator("constraints")
@@ -127,20 +135,19 @@ class CategoricalCnvProperties(BaseModel):
         copy_found = False
 
         for constraint in v:
-            if not defining_context_found:
-                defining_context_found = (
-                    isinstance(constraint, DefiningContextConstraint)
-                    and constraint.relations
-                    and Relation.SEQUENCE_LIFTOVER in constraint.relations
-                )
-
-            if not copy_found:
-                copy_found = isinstance(
-                    constraint, CopyChangeConstraint | CopyCountConstraint
-                )
+            if isinstance(constraint, DefiningContextConstraint):
+                if not defining_context_found and constraint.relations:
+                    defining_context_found = (
+                        Relation.SEQUENCE_LIFTOVER in constraint.relations
+                    )
+            elif isinstance(constraint, CopyChangeConstraint | CopyCountConstraint):
+                copy_found = True
+
+            if defining_context_found and copy_found:
+                break
 
         if not defining_context_found:
-            err_msg = f"At least one item in `constraints` must be a `DefiningContextConstraint`` and contain ``{Relation.SEQUENCE_LIFTOVER}` in `relations`."
+            err_msg = f"At least one item in `constraints` must be a `DefiningContextConstraint` and contain `{Relation.SEQUENCE_LIFTOVER.value}` in `relations`."
             raise ValueError(err_msg)
 
         if not copy_found:
@@ -0,0 +1,48 @@
+"""Serialize Cat-VRS objects to and from CBOR.
+
+`CBOR <https://cbor.io/>`_ is a compact binary encoding of the JSON data model, so
+Cat-VRS objects round-trip through it without loss. Requires the ``cbor`` extra
+(``pip install ga4gh.cat_vrs[cbor]``).
+"""
+
+from typing import Any, TypeVar, overload
+
+import cbor2
+from ga4gh.cat_vrs.core_models import adapter
+from pydantic import BaseModel
+
+_T = TypeVar("_T")
+
+
+def to_cbor(model: BaseModel) -> bytes:
+    """Serialize a Cat-VRS object to CBOR
+
+    :param model: Cat-VRS object, e.g. a ``CategoricalVariant`` or constraint
+    :return: CBOR encoding of the JSON-mode dump of ``model``, excluding ``None``
+        values
+    """
+    return cbor2.dumps(model.model_dump(mode="json", exclude_none=True))
+
+
+@overload
+def from_cbor(cls: type[_T], blob: bytes) -> _T: ...
+
+
+@overload
+def from_cbor(cls: Any, blob: bytes) -> Any: ...  # noqa: ANN401
+
+
+def from_cbor(cls: Any, blob: bytes) -> Any:
+    """Deserialize and validate a Cat-VRS object from CBOR
+
+    >>> from ga4gh.cat_vrs.core_models import Constraint, CopyCountConstraint
+    >>> from_cbor(Constraint, to_cbor(CopyCountConstraint(copies=2)))
+    CopyCountConstraint(type='CopyCountConstraint', copies=2)
+
+    :param cls: Model class or type (e.g. ``CategoricalVariant`` or ``Constraint``)
+        to validate against
+    :param blob: CBOR-encoded object
+    :return: Validated ``cls`` object (for a union type such as ``Constraint``, the
+        matching member model)
+    """
+    return adapter(cls).validate_python(cbor2.loads(blob))
@@ -0,0 +1,72 @@
+"""Module for pytest fixtures"""
+
+import pytest
+from ga4gh.cat_vrs import adapter
+from ga4gh.cat_vrs.core_models import Constraint
+
+
+@pytest.fixture(scope="session")
+def allele():
+    """Create a VRS Allele, as a dict"""
+    return {
+        "type": "Allele",
+        "location": {
+            "type": "SequenceLocation",
+            "sequenceReference": {
+                "type": "SequenceReference",
+                "refgetAccession": "SQ.ss8r_wB0-b9r44TQTMmVTI92884QvBiB",
+            },
+            "start": 140753335,
+            "end": 140753336,
+        },
+        "state": {"type": "LiteralSequenceExpression", "sequence": "T"},
+    }
+
+
+@pytest.fixture(scope="session")
+def copy_count_constraint():
+    """Create a CopyCountConstraint, as a dict"""
+    return {"type": "CopyCountConstraint", "copies": [2, None]}
+
+
+@pytest.fixture(scope="session")
+def copy_change_constraint():
+    """Create a CopyChangeConstraint, as a dict"""
+    return {
+        "type": "CopyChangeConstraint",
+        "copyChange": {"code": "EFO:0030067", "system": "https://www.ebi.ac.uk/efo/"},
+    }
+
+
+@pytest.fixture(scope="session")
+def defining_context_constraint(allele):
+    """Create a DefiningContextConstraint factory. Takes the ``relations`` to use and
+    an optional ``definingContext`` (defaults to ``allele``).
+    """
+
+    def _defining_context_constraint(relations, defining_context=None):
+        return {
+            "type": "DefiningContextConstraint",
+            "definingContext": defining_context or allele,
+            "relations": relations,
+        }
+
+    return _defining_context_constraint
+
+
+@pytest.fixture(
+    params=[
+        "defining_context_constraint",
+        "copy_count_constraint",
+        "copy_change_constraint",
+    ]
+)
+def constraint(request):
+    """Create each type of constraint, as a model"""
+    if request.param == "defining_context_constraint":
+        data = request.getfixturevalue(request.param)(
+            ["sequence_liftover"], "ga4gh:VA.1"
+        )
+    else:
+        data = request.getfixturevalue(request.param)
+    return adapter(Constraint).validate_python(data)
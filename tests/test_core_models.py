@@ -0,0 +1,60 @@
+"""Test Cat-VRS core models"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from ga4gh.cat_vrs import adapter
+from ga4gh.cat_vrs.core_models import (
+    CategoricalVariant,
+    Constraint,
+    CopyCountConstraint,
+)
+from ga4gh.cat_vrs.profile_models import CanonicalAllele
+from pydantic import TypeAdapter, ValidationError
+
+
+def test_adapter(copy_count_constraint):
+    """Test that adapter returns cached type adapters"""
+    constraint_adapter = adapter(Constraint)
+    assert isinstance(constraint_adapter, TypeAdapter)
+    assert adapter(Constraint) is constraint_adapter
+    assert adapter(CanonicalAllele) is adapter(CanonicalAllele)
+    assert adapter(CanonicalAllele) is not adapter(CategoricalVariant)
+
+    constraint = constraint_adapter.validate_python(copy_count_constraint)
+    assert isinstance(constraint, CopyCountConstraint)
+
+    with pytest.raises(ValidationError):
+        constraint_adapter.validate_python({"type": "Unknown"})
+
+
+@pytest.mark.parametrize(
+    ("field_docs", "expected"),
+    [
+        (None, True),
+        ("1", True),
+        ("true", True),
+        ("0", False),
+        ("false", False),
+        ("No", False),
+    ],
+)
+def test_field_docs(field_docs, expected):
+    """Test that CATVRS_FIELD_DOCS controls whether field descriptions are kept"""
+    env = {k: v for k, v in os.environ.items() if k != "CATVRS_FIELD_DOCS"}
+    if field_docs is not None:
+        env["CATVRS_FIELD_DOCS"] = field_docs
+    code = (
+        "from ga4gh.cat_vrs.core_models import CategoricalVariant; "
+        "print(CategoricalVariant.model_fields['members'].description)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],  # noqa: S603
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert (result.stdout.strip() != "None") is expected
@@ -0,0 +1,140 @@
+"""Test Cat-VRS profile model constraints validators"""
+
+import pytest
+from ga4gh.cat_vrs.core_models import DefiningContextConstraint
+from ga4gh.cat_vrs.profile_models import (
+    CanonicalAllele,
+    CategoricalCnv,
+    ProteinSequenceConsequence,
+)
+from pydantic import ValidationError
+
+
+@pytest.fixture()
+def constraints(request, defining_context_constraint):
+    """Create a constraints factory. Each spec is either the name of a constraint
+    fixture or the arguments to ``defining_context_constraint``.
+    """
+
+    def _constraints(specs):
+        return [
+            request.getfixturevalue(spec)
+            if isinstance(spec, str)
+            else defining_context_constraint(*spec)
+            for spec in specs
+        ]
+
+    return _constraints
+
+
+def test_protein_sequence_consequence(constraints):
+    """Test that ProteinSequenceConsequence accepts valid constraints"""
+    psc = ProteinSequenceConsequence(
+        constraints=constraints(["copy_count_constraint", (["codon_translation"],)])
+    )
+    assert isinstance(psc.constraints[1], DefiningContextConstraint)
+
+
+@pytest.mark.parametrize(
+    "specs",
+    [
+        [(["codon_translation", "codon_translation"],)],
+        [(["sequence_liftover"],)],
+        [(None,)],
+        ["copy_count_constraint"],
+        [],
+    ],
+    ids=[
+        "duplicate_codon_translation",
+        "no_codon_translation",
+        "no_relations",
+        "no_defining_context",
+        "empty",
+    ],
+)
+def test_protein_sequence_consequence_invalid(constraints, specs):
+    """Test that ProteinSequenceConsequence rejects invalid constraints"""
+    with pytest.raises(ValidationError):
+        ProteinSequenceConsequence(constraints=constraints(specs))
+
+
+def test_canonical_allele(constraints):
+    """Test that CanonicalAllele accepts valid constraints"""
+    assert CanonicalAllele(
+        constraints=constraints(
+            [
+                "copy_change_constraint",
+                (["sequence_liftover", "transcript_projection"],),
+            ]
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "specs",
+    [
+        [(["sequence_liftover"],)],
+        [
+            (
+                [
+                    "sequence_liftover",
+                    "transcript_projection",
+                    "transcript_projection",
+                ],
+            )
+        ],
+        [(None,)],
+        ["copy_change_constraint"],
+    ],
+    ids=[
+        "no_transcript_projection",
+        "duplicate_transcript_projection",
+        "no_relations",
+        "no_defining_context",
+    ],
+)
+def test_canonical_allele_invalid(constraints, specs):
+    """Test that CanonicalAllele rejects invalid constraints"""
+    with pytest.raises(ValidationError):
+        CanonicalAllele(constraints=constraints(specs))
+
+
+@pytest.mark.parametrize(
+    "specs",
+    [
+        [(["sequence_liftover"], "ga4gh:VA.1234"), "copy_count_constraint"],
+        ["copy_count_constraint", (["sequence_liftover"], "ga4gh:VA.1234")],
+        [(["sequence_liftover"], "ga4gh:VA.1234"), "copy_change_constraint"],
+        ["copy_change_constraint", (["sequence_liftover"], "ga4gh:VA.1234")],
+    ],
+    ids=[
+        "copy_count_last",
+        "copy_count_first",
+        "copy_change_last",
+        "copy_change_first",
+    ],
+)
+def test_categorical_cnv(constraints, specs):
+    """Test that CategoricalCnv accepts valid constraints"""
+    assert CategoricalCnv(constraints=constraints(specs))
+
+
+@pytest.mark.parametrize(
+    "specs",
+    [
+        [(["sequence_liftover"], "ga4gh:VA.1234")],
+        ["copy_count_constraint"],
+        [(["codon_translation"],), "copy_count_constraint"],
+        [(None,), "copy_change_constraint"],
+    ],
+    ids=[
+        "no_copy_constraint",
+        "no_defining_context",
+        "codon_translation",
+        "no_relations",
+    ],
+)
+def test_categorical_cnv_invalid(constraints, specs):
+    """Test that CategoricalCnv rejects invalid constraints"""
+    with pytest.raises(ValidationError):
+        CategoricalCnv(constraints=constraints(specs))
@@ -0,0 +1,35 @@
+"""Test CBOR serialization of Cat-VRS objects"""
+
+from ga4gh.cat_vrs.core_models import CategoricalVariant, Constraint
+from ga4gh.cat_vrs.profile_models import CanonicalAllele
+from ga4gh.cat_vrs.serialization import from_cbor, to_cbor
+
+
+def test_categorical_variant(allele, copy_count_constraint):
+    """Test that CategoricalVariant objects round-trip through CBOR"""
+    cv = CategoricalVariant(
+        id="cv:1",
+        members=[allele, "ga4gh:VA.1"],
+        constraints=[copy_count_constraint],
+    )
+    blob = to_cbor(cv)
+    assert isinstance(blob, bytes)
+    assert from_cbor(CategoricalVariant, blob) == cv
+
+
+def test_profile(allele, defining_context_constraint):
+    """Test that profile objects round-trip through CBOR"""
+    canonical_allele = CanonicalAllele(
+        members=[allele],
+        constraints=[
+            defining_context_constraint(["sequence_liftover", "transcript_projection"])
+        ],
+    )
+    assert from_cbor(CanonicalAllele, to_cbor(canonical_allele)) == canonical_allele
+
+
+def test_constraint(constraint):
+    """Test that each constraint type round-trips through CBOR as a Constraint"""
+    round_tripped = from_cbor(Constraint, to_cbor(constraint))
+    assert type(round_tripped) is type(constraint)
+    assert round_tripped == constraint
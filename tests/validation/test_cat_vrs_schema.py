@@ -1,9 +1,9 @@
 """Test that Cat VRS-Python Pydantic models match corresponding schemas"""
 
-import json
 from enum import Enum
 from pathlib import Path
 
+import orjson
 import pytest
 from ga4gh.cat_vrs import core_models, profile_models
 from pydantic import BaseModel
@@ -28,13 +28,18 @@ class CatVrsSchemaMapping(BaseModel):
 def _update_cat_vrs_schema_mapping(
     f_path: Path, cat_vrs_schema_mapping: CatVrsSchemaMapping
 ) -> None:
-    """Update ``cat_vrs_schema_mapping`` properties
+    """Update ``cat_vrs_schema_mapping`` properties. Files that are not JSON Schema
+    class definitions (not JSON, or no ``title``) are skipped.
 
     :param f_path: Path to JSON Schema file
     :param cat_vrs_schema_mapping: Cat-VRS schema mapping to update
     """
-    with f_path.open() as rf:
-        cls_def = json.load(rf)
+    try:
+        cls_def = orjson.loads(f_path.read_bytes())
+    except orjson.JSONDecodeError:
+        return
+    if not isinstance(cls_def, dict) or "title" not in cls_def:
+        return
 
     spec_class = cls_def["title"]
     cat_vrs_schema_mapping.schema[spec_class] = cls_def
@@ -62,8 +67,10 @@ for child in SUBMODULES_DIR.iterdir():
         continue
 
     mapping = CAT_VRS_SCHEMA_MAPPING[mapping_key]
+    # Generated JSON Schema files are named after their class, without an extension
     for f in (child / "json").glob("*"):
-        _update_cat_vrs_schema_mapping(f, mapping)
+        if f.is_file() and not f.name.startswith(".") and f.suffix in {"", ".json"}:
+            _update_cat_vrs_schema_mapping(f, mapping)
 
 
 @pytest.mark.parametrize(
@@ -95,14 +102,16 @@ def test_schema_class_fields(cat_vrs_schema, pydantic_models):
     """
     mapping = CAT_VRS_SCHEMA_MAPPING[cat_vrs_schema]
     for schema_model in mapping.concrete_classes:
-        schema_properties = mapping.schema[schema_model]["properties"]
+        schema_def = mapping.schema[schema_model]
+        schema_properties = schema_def["properties"]
         pydantic_model = getattr(pydantic_models, schema_model)
-        assert set(pydantic_model.model_fields) == set(schema_properties), schema_model
+        pydantic_model_fields = pydantic_model.model_fields
+        assert set(pydantic_model_fields) == set(schema_properties), schema_model
 
-        required_schema_fields = set(mapping.schema[schema_model]["required"])
+        required_schema_fields = set(schema_def["required"])
 
         for prop, property_def in schema_properties.items():
-            pydantic_model_field_info = pydantic_model.model_fields[prop]
+            pydantic_model_field_info = pydantic_model_fields[prop]
             pydantic_field_required = pydantic_model_field_info.is_required()
 
             if prop in required_schema_fields: